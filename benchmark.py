@@ -0,0 +1,249 @@
+import argparse
+import csv
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import utils
+from dto.word_search import WordSearchResult
+from fixture_corpus import FixtureCorpus, FixtureCorpusWriter, FixtureKind
+from naver_session import NaverSession
+from naver_vocab import (
+    SEARCH_HEADERS,
+    get_dictionary_type,
+    get_search_link,
+    get_words_response,
+)
+from naver_vocab_book import NaverVocabBook
+from naver_vocab_entry import get_entry_dict
+from utils import RegexPattern
+
+CLEAN_PATTERNS = [
+    RegexPattern.PARENTHESIS,
+    RegexPattern.PARENTHESIS_HANGUL,
+    RegexPattern.HTML,
+]
+
+# 결과 파일만 보고도 각 값이 무엇을 잰 것인지 알 수 있도록 함께 저장함
+METRICS = {
+    "best_s": "가장 빠른 1회 실행 시간 (초)",
+    "median_s": "1회 실행 시간의 중앙값 (초)",
+    "items_per_s": "median_s 기준 초당 처리 항목 수",
+    "peak_bytes": "tracemalloc으로 잰 1회 실행 중 최대 메모리 사용량 (바이트)",
+    "net_blocks": (
+        "1회 실행 전후 tracemalloc 블록 수 차이 (할당 횟수가 아니라 실행 후 "
+        "남은 블록 수이며, 해제된 임시 객체는 포함되지 않음)"
+    ),
+}
+
+
+class BenchmarkCase(NamedTuple):
+    name: str
+    items: int
+    run: Callable[[], object]
+
+
+def record(args: argparse.Namespace):
+    session = NaverSession.from_file(args.session)
+    book_type = NaverVocabBook.Type(args.book_type)
+    count = 0
+
+    with FixtureCorpusWriter.open(args.corpus) as writer:
+        for book_id in args.book_id:
+            book = NaverVocabBook(book_id=book_id, book_name="", book_type=book_type)
+            cursor = None
+
+            while (
+                (response := get_words_response(session, book=book, cursor=cursor))
+                and response["data"]
+                and response["data"]["over_last_page"] is False
+            ):
+                for item in response["data"]["m_items"]:
+                    if item["content"]:
+                        writer.write(FixtureKind.CONTENT, book_type, item["content"])
+                        count += 1
+
+                cursor = response["data"]["next_cursor"]
+
+        if args.words:
+            with open(args.words, mode="r", encoding="utf-8") as file:
+                words = [row[0].strip() for row in csv.reader(file) if row[0]]
+
+            dict_type = get_dictionary_type(book_type)
+
+            for word in words:
+                writer.write(
+                    FixtureKind.SEARCH,
+                    book_type,
+                    session.get(
+                        get_search_link(dict_type, word),
+                        headers=SEARCH_HEADERS,
+                        parse=lambda res: res.content,
+                    ),
+                )
+                count += 1
+                time.sleep(0.3)
+
+    print(f"{count}개 레코드를 {args.corpus}에 저장했습니다.")
+
+
+def get_cases(corpus: FixtureCorpus) -> list[BenchmarkCase]:
+    # payload는 측정 전에 한 번만 bytes로 복사해 두고, 측정에는 파싱만 포함함
+    contents = [
+        (record.book_type, record.payload.tobytes())
+        for record in corpus.get_records(FixtureKind.CONTENT)
+    ]
+    searches = [
+        record.payload.tobytes() for record in corpus.get_records(FixtureKind.SEARCH)
+    ]
+
+    # utils.clean의 입력은 get_word/get_pron/get_meaning이 실제로 정리하는 문자열
+    clean_inputs: list[str] = []
+    for _, payload in contents:
+        entry = json.loads(payload)["entry"]
+        member = entry["members"][0]
+        clean_inputs += [member["kanji"], member["entry_name"]]
+        clean_inputs += [mean["show_mean"] for mean in entry["means"]]
+    clean_inputs = [raw for raw in clean_inputs if raw]
+
+    def _run_get_entry_dict():
+        for book_type, payload in contents:
+            get_entry_dict(book_type, json.loads(payload))
+
+    def _run_clean():
+        for raw in clean_inputs:
+            for pattern in CLEAN_PATTERNS:
+                utils.clean(raw, pattern=pattern)
+
+    def _run_model_validate():
+        for payload in searches:
+            WordSearchResult.model_validate(json.loads(payload))
+
+    return [
+        case
+        for case in [
+            BenchmarkCase("get_entry_dict", len(contents), _run_get_entry_dict),
+            BenchmarkCase(
+                "utils.clean", len(clean_inputs) * len(CLEAN_PATTERNS), _run_clean
+            ),
+            BenchmarkCase(
+                "WordSearchResult.model_validate", len(searches), _run_model_validate
+            ),
+        ]
+        if case.items
+    ]
+
+
+def measure(case: BenchmarkCase, warmup: int, repeat: int):
+    for _ in range(warmup):
+        case.run()
+
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            case.run()
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+
+    # CPython에는 전체 할당 횟수를 싸게 셀 방법이 없으므로 할당 횟수 대신
+    # tracemalloc으로 한 번 더 실행해 최대 사용량과 실행 후 남은 블록 수를 기록함
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    case.run()
+    after = tracemalloc.take_snapshot()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(timings)
+
+    return {
+        "items": case.items,
+        "repeat": repeat,
+        "best_s": min(timings),
+        "median_s": median,
+        "items_per_s": case.items / median if median else None,
+        "peak_bytes": peak_bytes,
+        "net_blocks": sum(
+            stat.count_diff for stat in after.compare_to(before, "filename")
+        ),
+    }
+
+
+def run_cases(corpus: FixtureCorpus, warmup: int, repeat: int):
+    results = {}
+
+    for case in get_cases(corpus):
+        results[case.name] = measure(case, warmup, repeat)
+        print(
+            f"{case.name}: {results[case.name]['items_per_s']:,.0f} items/s "
+            f"({case.items} items)"
+        )
+
+    return results
+
+
+def run(args: argparse.Namespace):
+    with FixtureCorpus(args.corpus) as corpus:
+        report = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "corpus": {"path": str(args.corpus), "records": len(corpus)},
+            "metrics": METRICS,
+            "benchmarks": run_cases(corpus, args.warmup, args.repeat),
+        }
+
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"결과를 {args.output}에 저장했습니다.")
+
+
+def compare(args: argparse.Namespace):
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))["benchmarks"]
+    head = json.loads(Path(args.head).read_text(encoding="utf-8"))["benchmarks"]
+
+    for name in sorted(base.keys() & head.keys()):
+        ratio = head[name]["items_per_s"] / base[name]["items_per_s"]
+        print(f"{name}: {ratio:.2f}x")
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description="파싱 경로 성능 측정")
+    subparsers = parser.add_subparsers(required=True)
+
+    record_parser = subparsers.add_parser("record", help="코퍼스 기록")
+    record_parser.add_argument("corpus", type=Path)
+    record_parser.add_argument("--session", required=True)
+    record_parser.add_argument(
+        "--book-type", choices=[t.value for t in NaverVocabBook.Type], required=True
+    )
+    record_parser.add_argument("--book-id", action="append", default=[])
+    record_parser.add_argument("--words", type=Path, help="검색할 단어 CSV (첫 열)")
+    record_parser.set_defaults(func=record)
+
+    run_parser = subparsers.add_parser("run", help="벤치마크 실행")
+    run_parser.add_argument("corpus", type=Path)
+    run_parser.add_argument("--output", default="bench_output.json")
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser("compare", help="두 결과 비교")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("head")
+    compare_parser.set_defaults(func=compare)
+
+    return parser
+
+
+if __name__ == "__main__":
+    args = get_parser().parse_args()
+    args.func(args)
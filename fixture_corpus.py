@@ -0,0 +1,121 @@
+import enum
+import mmap
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple
+
+from naver_vocab_book import NaverVocabBook
+
+# 파일 구조: MAGIC + (RECORD_HEADER + payload)*
+# payload는 UTF-8 JSON이며 RECORD_HEADER의 길이만큼 이어짐
+MAGIC = b"NVFC\x00\x00\x00\x01"
+RECORD_HEADER = struct.Struct("<BBI")
+
+BOOK_TYPES = list(NaverVocabBook.Type)
+
+
+class FixtureKind(enum.IntEnum):
+    CONTENT = 1  # 단어장 항목의 content
+    SEARCH = 2  # 검색 API 응답
+
+
+class FixtureRecord(NamedTuple):
+    kind: FixtureKind
+    book_type: NaverVocabBook.Type
+    payload: memoryview
+
+
+class FixtureCorpusWriter:
+    file: BinaryIO
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        self.file.write(MAGIC)
+
+    @classmethod
+    def open(cls, file_name: str | Path):
+        return cls(open(file_name, "wb"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.file.close()
+
+    def write(
+        self, kind: FixtureKind, book_type: NaverVocabBook.Type, payload: str | bytes
+    ):
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+
+        self.file.write(
+            RECORD_HEADER.pack(kind, BOOK_TYPES.index(book_type), len(payload))
+        )
+        self.file.write(payload)
+
+
+# 파일 전체를 메모리에 매핑하고, 각 레코드는 복사 없이 memoryview로 돌려줌
+class FixtureCorpus:
+    def __init__(self, file_name: str | Path):
+        self.file_name = Path(file_name)
+
+        with open(self.file_name, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._view = memoryview(self._mmap)
+
+        if self._view[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.file_name} is not a fixture corpus")
+
+        self._offsets = self._scan()
+
+    def _scan(self):
+        offsets: list[tuple[int, int, int, int]] = []
+        offset = len(MAGIC)
+
+        while offset < len(self._view):
+            kind, book_type, length = RECORD_HEADER.unpack_from(self._view, offset)
+            offset += RECORD_HEADER.size
+            offsets.append((kind, book_type, offset, length))
+            offset += length
+
+        return offsets
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._mmap.closed:
+            return
+
+        self._view.release()
+
+        try:
+            self._mmap.close()
+        except BufferError as e:
+            # 레코드의 payload가 남아 있으면 닫을 수 없으므로 열린 상태로 되돌림
+            self._view = memoryview(self._mmap)
+            raise BufferError(
+                f"cannot close {self.file_name}: record payloads are still referenced"
+            ) from e
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __iter__(self) -> Iterator[FixtureRecord]:
+        for kind, book_type, offset, length in self._offsets:
+            yield FixtureRecord(
+                FixtureKind(kind),
+                BOOK_TYPES[book_type],
+                self._view[offset : offset + length],
+            )
+
+    def get_records(self, kind: FixtureKind) -> list[FixtureRecord]:
+        return [record for record in self if record.kind == kind]
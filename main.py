@@ -1,15 +1,23 @@
+import asyncio
 import csv
 import enum
-import time
 from pathlib import Path
-from typing import NamedTuple
+from typing import Callable, Iterable, NamedTuple
 
 import inquirer
-from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
 
+import pron_audio
+from naver_async_session import NaverAsyncSession
+from naver_metadata_cache import NaverMetadataCache, get_account_key
+from naver_request import NaverRequestError
 from naver_session import NaverSession
-from naver_vocab import NaverVocab, get_dictionary_type, get_vocab_from_word
+from naver_vocab import NaverVocab
 from naver_vocab_book import NaverVocabBook
+from naver_vocab_book_cache import NaverVocabBookCache
+from naver_vocab_entry import DEFAULT_PROFILE, FULL_PROFILE, ExtractionProfile
+from naver_vocab_index import NaverVocabIndex
+from naver_vocab_lookup import lookup_words, lookup_words_sharded
 
 
 def inquire_bool(message: str) -> bool:
@@ -36,10 +44,23 @@ def inquire_is_download_pron_files():
     )
 
 
+def inquire_is_process_pron_files():
+    return inquire_bool(
+        "발음 파일의 음량을 맞추고 용량이 작은 형식(Opus)으로 변환하시겠습니까? (ffmpeg 필요)"
+    )
+
+
 def inquire_examples():
     return inquire_bool("예문을 추가 하시겠습니까? (CSV에 예문이 추가됩니다)")
 
 
+def inquire_extraction_profile() -> ExtractionProfile:
+    if inquire_bool("모든 뜻과 예문을 가져오시겠습니까? (아니오: 첫 번째 뜻과 예문만)"):
+        return FULL_PROFILE
+
+    return DEFAULT_PROFILE
+
+
 def inquire_path(message: str, is_directory: bool = False) -> Path:
     questions = [inquirer.Path("path", message=message)]
     answers = inquirer.prompt(questions)
@@ -92,6 +113,7 @@ def inquire_book_type() -> NaverVocabBook.Type:
 class VocabLocation(enum.Enum):
     naver_vocab_book = enum.auto()
     csv = enum.auto()
+    csv_sharded = enum.auto()
 
 
 def inquire_vocab_location() -> VocabLocation:
@@ -102,6 +124,10 @@ def inquire_vocab_location() -> VocabLocation:
             choices=[
                 ("네이버 단어장에서 불러오기", VocabLocation.naver_vocab_book),
                 ("CSV에서 불러오기 (첫 열)", VocabLocation.csv),
+                (
+                    "CSV에서 불러오기 (첫 열, 여러 프로세스로 나눠서 처리)",
+                    VocabLocation.csv_sharded,
+                ),
             ],
         ),
     ]
@@ -114,18 +140,26 @@ def inquire_book_id(books: list[NaverVocabBook]) -> str:
         inquirer.List(
             "book_id",
             message="단어장을 선택하세요",
-            choices=[(book.book_name, book.book_id) for book in books],
+            choices=[
+                (
+                    f"{book.book_name} ({book.word_count})"
+                    if book.word_count is not None
+                    else book.book_name,
+                    book.book_id,
+                )
+                for book in books
+            ],
         ),
     ]
     answers = inquirer.prompt(questions)
     return answers["book_id"]
 
 
-def get_session():
+def get_session() -> tuple[NaverSession, Path]:
     try:
         if inquire_is_session_load():
             session_file_path = inquire_sesion_file_path()
-            return NaverSession.from_file(session_file_path)
+            return NaverSession.from_file(session_file_path), session_file_path
 
     except FileNotFoundError:
         print("세션 파일을 찾지 못했습니다. 로그인을 진행합니다.")
@@ -137,21 +171,84 @@ def get_session():
     session = NaverSession.login(username, password)
     session.save(session_file)
 
-    return session
+    return session, session_file
 
 
 class PronFileTuple(NamedTuple):
     vocab_id: str
+    word: str
     path: Path
     link: str
 
 
-def _download_pron_files(session: NaverSession, file_tuples: list[PronFileTuple]):
-    download_tqdm = tqdm(file_tuples)
-    download_tqdm.set_description("발음 파일을 다운로드하는 중")
-    for file_tuple in download_tqdm:
-        with open(file_tuple.path, "wb") as f:
-            f.write(session.session.get(file_tuple.link).content)
+def _log_failed_words(words: Iterable[str]):
+    with open("log.txt", "a+") as log_file:
+        log_file.writelines(f"{word}\n" for word in words)
+
+
+async def _get_pron_file_tuple(
+    async_session: NaverAsyncSession,
+    vocab: NaverVocab,
+    get_path: Callable[[str], Path],
+):
+    if not (file_name := vocab.get_pron_file_name()):
+        return None
+
+    try:
+        link = await async_session.get_pron_file_link(vocab)
+    except NaverRequestError:
+        # 한 단어가 실패해도 나머지 발음 파일은 계속 받음
+        _log_failed_words([vocab.word])
+        return None
+
+    if not link:
+        return None
+
+    return PronFileTuple(
+        vocab_id=vocab.id, word=vocab.word, path=get_path(file_name), link=link
+    )
+
+
+async def _download_pron_file(
+    async_session: NaverAsyncSession, file_tuple: PronFileTuple
+):
+    try:
+        await async_session.download_pron_file(file_tuple.link, file_tuple.path)
+    except (NaverRequestError, OSError):
+        _log_failed_words([file_tuple.word])
+        return None
+
+    return file_tuple
+
+
+async def _download_pron_files(
+    session: NaverSession, vocabs: list[NaverVocab], get_path: Callable[[str], Path]
+):
+    async with NaverAsyncSession.from_session(session) as async_session:
+        file_tuples = [
+            file_tuple
+            for file_tuple in await tqdm_asyncio.gather(
+                *(
+                    _get_pron_file_tuple(async_session, vocab, get_path)
+                    for vocab in vocabs
+                ),
+                desc="발음 파일 링크를 가져오는 중",
+            )
+            if file_tuple
+        ]
+
+        # 다운로드에 성공한 파일만 CSV에 추가함
+        return [
+            file_tuple
+            for file_tuple in await tqdm_asyncio.gather(
+                *(
+                    _download_pron_file(async_session, file_tuple)
+                    for file_tuple in file_tuples
+                ),
+                desc="발음 파일을 다운로드하는 중",
+            )
+            if file_tuple
+        ]
 
 
 def _get_front_and_back(
@@ -169,42 +266,67 @@ def _get_front_and_back(
 
 
 def main():
-    session = get_session()
+    session, session_file = get_session()
+    metadata_cache = NaverMetadataCache.from_file(get_account_key(session_file))
+    metadata_cache.refresh_in_background(session)
+    index = NaverVocabIndex.from_file()
+    book_cache = NaverVocabBookCache.from_file()
 
     while True:
         book_type = inquire_book_type()
         vocab_location = inquire_vocab_location()
+        profile = inquire_extraction_profile()
 
         if vocab_location == VocabLocation.naver_vocab_book:
-            books = NaverVocabBook.get_book_list(session, book_type)
+            books = metadata_cache.get_book_list(session, book_type)
             book_id = inquire_book_id(books)
-            selected_book = NaverVocabBook.get_book_from_id(session, book_id, book_type)
-            selected_book.load_vocabs(session)
+            selected_book = next(book for book in books if book.book_id == book_id)
+            selected_book.load_vocabs(session, book_cache, profile)
             vocabs = selected_book.vocabs
 
-        elif vocab_location == VocabLocation.csv:
+            # 색인은 기본 프로필로 가져온 단어만 담음
+            if profile == DEFAULT_PROFILE:
+                index.add(book_type, vocabs)
+
+        elif vocab_location in (VocabLocation.csv, VocabLocation.csv_sharded):
             input_csv_file_location = inquire_csv_file_path()
 
             with open(input_csv_file_location, mode="r", encoding="utf-8") as file:
                 words = [row[0].strip() for row in csv.reader(file) if row[0]]
 
-            vocabs = []
+            # 색인은 기본 프로필로 가져온 단어만 담음
+            indexed_vocabs = (
+                {word: vocab for word in words if (vocab := index.get(book_type, word))}
+                if profile == DEFAULT_PROFILE
+                else {}
+            )
+            missing_words = [word for word in words if word not in indexed_vocabs]
+
+            if vocab_location == VocabLocation.csv_sharded:
+                result = lookup_words_sharded(
+                    session, book_type, missing_words, profile
+                )
+            else:
+                result = lookup_words(session, book_type, missing_words, profile)
 
-            for word in tqdm(words, desc="네이버 단어장에서 단어 가져오는 중"):
-                try:
-                    vocab = get_vocab_from_word(
-                        session, get_dictionary_type(book_type), word
-                    )
+            found_vocabs = {word: vocab for word, vocab in result.vocabs if vocab}
 
-                    if vocab:
-                        vocabs.append(vocab)
+            # 단어마다 커밋하지 않도록 한 번에 기록함
+            if profile == DEFAULT_PROFILE:
+                index.add(book_type, list(found_vocabs.values()))
+                index.add_queries(
+                    book_type,
+                    [(word, vocab.id) for word, vocab in found_vocabs.items()],
+                )
 
-                except Exception:
-                    with open("log.txt", "a+") as log_file:
-                        log_file.write(f"{word}\n")
-                    pass
+            if result.failed:
+                _log_failed_words(result.failed)
 
-                time.sleep(0.3)
+            vocabs = [
+                vocab
+                for word in words
+                if (vocab := indexed_vocabs.get(word) or found_vocabs.get(word))
+            ]
 
         else:
             raise NotImplementedError
@@ -216,25 +338,29 @@ def main():
 
         if inquire_is_download_pron_files():
 
-            def _add_file_prefix(path: str):
-                return f"{csv_file_path.stem}-{path}"
+            def _get_pron_file_path(file_name: str):
+                return folder_path.joinpath(f"{csv_file_path.stem}-{file_name}")
 
             folder_path = inquire_pron_folder_path()
-
-            file_tuple_tqdm = tqdm(vocabs)
-            file_tuple_tqdm.set_description("발음 파일 링크를 가져오는 중")
-            file_tuples = [
-                PronFileTuple(
-                    vocab_id=vocab.id,
-                    path=folder_path.joinpath(Path(_add_file_prefix(file_name))),
-                    link=link,
-                )
-                for vocab in file_tuple_tqdm
-                if (link := vocab.get_pron_file_link(session))
-                and (file_name := vocab.get_pron_file_name())
-            ]
-
-            _download_pron_files(session, file_tuples)
+            file_tuples = asyncio.run(
+                _download_pron_files(session, vocabs, _get_pron_file_path)
+            )
+
+            if inquire_is_process_pron_files():
+                if pron_audio.is_available():
+                    report = pron_audio.process_files(
+                        [file_tuple.path for file_tuple in file_tuples]
+                    )
+                    outputs = {file.source: file.output for file in report.files}
+                    file_tuples = [
+                        file_tuple._replace(path=output)
+                        if (output := outputs.get(file_tuple.path))
+                        else file_tuple
+                        for file_tuple in file_tuples
+                    ]
+                    print(report)
+                else:
+                    print("ffmpeg를 찾지 못해 발음 파일을 변환하지 않았습니다.")
 
             for file_tuple in file_tuples:
                 extra_columns[file_tuple.vocab_id] += (
@@ -244,7 +370,7 @@ def main():
         if inquire_examples():
             for vocab in vocabs:
                 extra_columns[vocab.id] += (
-                    vocab.examples[0] if vocab.examples else "",
+                    "<br/>".join(vocab.examples) if vocab.examples else "",
                 )
 
         with open(csv_file_path, "w", encoding="utf8") as f:
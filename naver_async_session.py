@@ -0,0 +1,251 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Callable, TypeVar, cast
+
+import httpx
+
+from naver_request import (
+    DEFAULT_CIRCUIT_BREAKER,
+    DEFAULT_RETRY_POLICY,
+    CircuitBreaker,
+    NaverClientError,
+    NaverDeadlineExceededError,
+    NaverRequestError,
+    NaverTransientError,
+    RetryPolicy,
+    classify_parse_error,
+    classify_status,
+)
+from naver_session import NaverSession
+from naver_vocab import (
+    PRON_LINK_URL,
+    SEARCH_HEADERS,
+    NaverVocab,
+    NaverVocabListResponse,
+    get_search_link,
+    get_vocab_from_search_result,
+    get_words_link,
+    parse_pron_link,
+    parse_search_result,
+)
+from naver_vocab_book import NaverVocabBook, NaverVocabBookListResponse
+from naver_vocab_entry import DEFAULT_PROFILE, ExtractionProfile, get_entry_dict
+
+T = TypeVar("T")
+
+# HTTP/2는 연결 하나로 여러 요청을 동시에 보낼 수 있으므로 연결 수는 적게 유지함
+DEFAULT_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+DEFAULT_MAX_CONCURRENCY = 100
+
+
+class NaverAsyncSession:
+    client: httpx.AsyncClient
+    retry_policy: RetryPolicy
+    circuit_breaker: CircuitBreaker
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        circuit_breaker: CircuitBreaker = DEFAULT_CIRCUIT_BREAKER,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.client = client
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def _wait_circuit_breaker(self, deadline: float):
+        while remaining := self.circuit_breaker.get_remaining():
+            if time.monotonic() + remaining > deadline:
+                raise NaverDeadlineExceededError("circuit breaker is open")
+
+            await asyncio.sleep(remaining)
+
+    async def _send(
+        self, method: str, url: str, timeout: tuple[float, float], **kwargs
+    ):
+        connect_timeout, read_timeout = timeout
+
+        try:
+            async with self._semaphore:
+                res = await self.client.request(
+                    method,
+                    url,
+                    timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                    **kwargs,
+                )
+        # 본문을 받는 도중 끊기거나 압축 해제에 실패한 경우도 재시도함
+        except (
+            httpx.TimeoutException,
+            httpx.NetworkError,
+            httpx.RemoteProtocolError,
+            httpx.DecodingError,
+        ) as e:
+            raise NaverTransientError(f"{e!r} from {url}") from e
+        # 잘못된 주소, 지원하지 않는 프로토콜, 프록시 설정 오류 등은 재시도하지 않음
+        except (httpx.RequestError, httpx.InvalidURL) as e:
+            raise NaverClientError(f"{e!r} from {url}") from e
+
+        if error := classify_status(
+            url, res.status_code, res.headers.get("Retry-After")
+        ):
+            raise error
+
+        return res
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        parse: Callable[[httpx.Response], T] | None = None,
+        **kwargs,
+    ) -> T | httpx.Response:
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.deadline
+        attempt = 0
+
+        while True:
+            await self._wait_circuit_breaker(deadline)
+
+            if (remaining := deadline - time.monotonic()) <= 0:
+                raise NaverDeadlineExceededError(f"deadline exceeded for {url}")
+
+            try:
+                res = await self._send(
+                    method, url, policy.get_timeout(remaining), **kwargs
+                )
+
+                try:
+                    result = parse(res) if parse else res
+                except (ValueError, KeyError, IndexError, TypeError) as e:
+                    raise classify_parse_error(
+                        url, res.status_code, res.content, e
+                    ) from e
+
+            except NaverRequestError as e:
+                if isinstance(e, NaverTransientError):
+                    self.circuit_breaker.record_failure()
+
+                attempt += 1
+                await asyncio.sleep(policy.get_retry_delay(e, attempt, deadline))
+                continue
+
+            self.circuit_breaker.record_success()
+            return result
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def get_book_list_response(self, book_type: NaverVocabBook.Type):
+        return cast(
+            NaverVocabBookListResponse,
+            await self.get(
+                NaverVocabBook.get_book_list_link(book_type),
+                parse=lambda res: res.json(),
+            ),
+        )
+
+    async def get_book_list(self, book_type: NaverVocabBook.Type):
+        return NaverVocabBook.get_books_from_response(
+            await self.get_book_list_response(book_type), book_type
+        )
+
+    async def get_words_response(self, book: NaverVocabBook, cursor: str | None = None):
+        return cast(
+            NaverVocabListResponse,
+            await self.get(
+                get_words_link(book, cursor), parse=lambda res: json.loads(res.text)
+            ),
+        )
+
+    # 단어장 페이지는 커서로 이어지므로 한 단어장 안에서는 순서대로 가져옴
+    async def get_vocabs(
+        self, book: NaverVocabBook, profile: ExtractionProfile = DEFAULT_PROFILE
+    ):
+        cursor = None
+        words: list[NaverVocab] = []
+
+        while (
+            (response := await self.get_words_response(book, cursor))
+            and response["data"]
+            and response["data"]["over_last_page"] is False
+        ):
+            words += [
+                NaverVocab(
+                    id=item["id"],
+                    **get_entry_dict(
+                        book.book_type, json.loads(item["content"]), profile
+                    ),
+                )
+                for item in response["data"]["m_items"]
+                if item["content"]
+            ]
+
+            cursor = response["data"]["next_cursor"]
+
+        return words
+
+    async def get_vocab_from_word(
+        self,
+        dict_type: str,
+        word: str,
+        profile: ExtractionProfile = DEFAULT_PROFILE,
+    ):
+        result = await self.get(
+            get_search_link(dict_type, word),
+            headers=SEARCH_HEADERS,
+            parse=lambda res: parse_search_result(res.json()),
+        )
+        return get_vocab_from_search_result(result, profile)
+
+    async def get_pron_file_link(self, vocab: NaverVocab) -> str | None:
+        if vocab.pron_file is None:
+            return None
+
+        return await self.post(
+            PRON_LINK_URL,
+            data=vocab.get_pron_link_data(),
+            parse=lambda res: parse_pron_link(res.json()),
+        )
+
+    async def download_pron_file(self, link: str, path: Path):
+        res = await self.get(link)
+        path.write_bytes(res.content)
+
+    def save(self, file_name: str):
+        cookies = {cookie.name: cookie.value for cookie in self.client.cookies.jar}
+        with open(file_name, mode="w", encoding="utf8") as f:
+            f.write(json.dumps(cookies))
+
+    @classmethod
+    def from_cookies(
+        cls, cookies: dict, limits: httpx.Limits = DEFAULT_LIMITS, **kwargs
+    ):
+        client = httpx.AsyncClient(http2=True, limits=limits, cookies=cookies)
+        return cls(client, **kwargs)
+
+    @classmethod
+    def from_session(cls, naver_session: NaverSession, **kwargs):
+        return cls.from_cookies(naver_session.session.cookies.get_dict(), **kwargs)
+
+    @classmethod
+    def from_file(cls, file_name: str, **kwargs):
+        with open(file_name, mode="r", encoding="utf8") as f:
+            cookies = json.loads(f.read())
+        return cls.from_cookies(cookies, **kwargs)
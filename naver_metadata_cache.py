@@ -0,0 +1,128 @@
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+from naver_request import NaverRequestError
+from naver_session import NaverSession
+from naver_vocab_book import NaverVocabBook
+
+METADATA_CACHE_PATH = "naver_metadata.json"
+# 이 기간 동안 쓰지 않은 계정의 목록은 지움
+ACCOUNT_EXPIRY = 30 * 24 * 60 * 60
+
+logger = logging.getLogger(__name__)
+
+
+# 네이버 응답에는 계정을 구분할 값이 없으므로 세션 파일 경로로 구분함
+# 다시 로그인해도 같은 세션 파일에 저장하면 같은 키가 됨
+def get_account_key(session_file: str | Path):
+    return str(Path(session_file).resolve())
+
+
+# 계정별 단어장 목록을 저장해 두고 메뉴는 바로 보여준 뒤 백그라운드에서 갱신함
+class NaverMetadataCache:
+    file_name: Path
+    account_key: str
+
+    def __init__(self, file_name: str | Path, account_key: str, data: dict):
+        self.file_name = Path(file_name)
+        self.account_key = account_key
+        self._data = data
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, account_key: str, file_name: str | Path = METADATA_CACHE_PATH):
+        try:
+            with open(file_name, mode="r", encoding="utf8") as f:
+                data = json.loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+
+        cache = cls(file_name, account_key, data)
+        cache._evict_expired_accounts()
+        return cache
+
+    def _get_account(self) -> dict:
+        account = self._data.setdefault("accounts", {}).setdefault(
+            self.account_key, {"books": {}, "updated_at": {}}
+        )
+        account["used_at"] = time.time()
+        return account
+
+    def _evict_expired_accounts(self):
+        accounts = self._data.get("accounts", {})
+        expired_at = time.time() - ACCOUNT_EXPIRY
+
+        for key in [
+            key
+            for key, account in accounts.items()
+            if key != self.account_key and account.get("used_at", 0) < expired_at
+        ]:
+            del accounts[key]
+
+    def save(self):
+        # 저장 중에 종료되어도 기존 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체함
+        temp = self.file_name.with_name(f"{self.file_name.name}.tmp")
+
+        with self._lock:
+            with open(temp, mode="w", encoding="utf8") as f:
+                f.write(json.dumps(self._data, ensure_ascii=False))
+
+            temp.replace(self.file_name)
+
+    def get_books(self, book_type: NaverVocabBook.Type) -> list[NaverVocabBook] | None:
+        with self._lock:
+            items = self._get_account()["books"].get(str(book_type))
+
+        if items is None:
+            return None
+
+        return [NaverVocabBook.get_book_from_item(item, book_type) for item in items]
+
+    def set_books(self, book_type: NaverVocabBook.Type, books: list[NaverVocabBook]):
+        with self._lock:
+            account = self._get_account()
+            account["books"][str(book_type)] = [book.to_item() for book in books]
+            account["updated_at"][str(book_type)] = time.time()
+
+        self.save()
+
+    def get_book_list(
+        self, naver_session: NaverSession, book_type: NaverVocabBook.Type
+    ) -> list[NaverVocabBook]:
+        if (books := self.get_books(book_type)) is not None:
+            return books
+
+        books = NaverVocabBook.get_book_list(naver_session, book_type)
+        self.set_books(book_type, books)
+        return books
+
+    def refresh(
+        self,
+        naver_session: NaverSession,
+        book_types: list[NaverVocabBook.Type] = list(NaverVocabBook.Type),
+    ):
+        for book_type in book_types:
+            try:
+                self.set_books(
+                    book_type, NaverVocabBook.get_book_list(naver_session, book_type)
+                )
+            except (NaverRequestError, KeyError, TypeError, ValueError) as e:
+                # 갱신에 실패하면 저장된 목록을 그대로 사용함
+                logger.info("failed to refresh %s book list: %r", book_type, e)
+
+    def refresh_in_background(self, naver_session: NaverSession):
+        # requests.Session은 스레드 사이에서 공유하기에 안전하지 않으므로
+        # 같은 쿠키로 갱신 전용 세션을 따로 만듦
+        refresh_session = NaverSession.from_cookies(
+            naver_session.session.cookies.get_dict(),
+            retry_policy=naver_session.retry_policy,
+            circuit_breaker=naver_session.circuit_breaker,
+        )
+        thread = threading.Thread(
+            target=self.refresh, args=(refresh_session,), daemon=True
+        )
+        thread.start()
+        return thread
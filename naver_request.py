@@ -0,0 +1,212 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from multiprocessing.context import BaseContext
+
+
+class NaverRequestError(Exception):
+    retryable: bool = False
+
+    def __init__(self, message: str, *, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+# 네트워크 오류, 타임아웃, 429, 5xx 등 잠시 후 다시 시도하면 될 수 있는 오류
+class NaverTransientError(NaverRequestError):
+    retryable = True
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ):
+        super().__init__(message, status_code=status_code)
+        self.retry_after = retry_after
+
+
+# 4xx 등 다시 시도해도 결과가 같은 오류
+class NaverClientError(NaverRequestError):
+    pass
+
+
+# 응답은 받았지만 예상한 형식이 아닌 경우 (빈 응답은 재시도함)
+class NaverResponseError(NaverRequestError):
+    def __init__(
+        self, message: str, *, status_code: int | None = None, retryable: bool = False
+    ):
+        super().__init__(message, status_code=status_code)
+        self.retryable = retryable
+
+
+class NaverDeadlineExceededError(NaverRequestError):
+    pass
+
+
+TRANSIENT_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_status(
+    url: str, status_code: int, retry_after: str | None = None
+) -> NaverRequestError | None:
+    if status_code < 400:
+        return None
+
+    message = f"{status_code} from {url}"
+
+    if status_code in TRANSIENT_STATUS_CODES or status_code >= 500:
+        return NaverTransientError(
+            message,
+            status_code=status_code,
+            retry_after=parse_retry_after(retry_after),
+        )
+
+    return NaverClientError(message, status_code=status_code)
+
+
+def classify_parse_error(
+    url: str, status_code: int, content: bytes, error: Exception
+) -> NaverResponseError:
+    return NaverResponseError(
+        f"unexpected response from {url}: {error!r}",
+        status_code=status_code,
+        retryable=not content,
+    )
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    # 한 번의 시도에 대한 타임아웃 (connect, read)
+    attempt_timeout: tuple[float, float] = (5.0, 30.0)
+    # 재시도를 포함한 요청 하나의 전체 제한 시간
+    deadline: float = 120.0
+
+    def get_delay(self, attempt: int, error: NaverRequestError):
+        # full jitter
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+        if isinstance(error, NaverTransientError) and error.retry_after is not None:
+            delay = max(delay, min(error.retry_after, self.max_delay))
+
+        return delay
+
+    # 재시도할 수 없으면 오류를 그대로 던지고, 재시도할 수 있으면 기다릴 시간을 반환함
+    def get_retry_delay(self, error: NaverRequestError, attempt: int, deadline: float):
+        if not error.retryable or attempt >= self.max_attempts:
+            raise error
+
+        delay = self.get_delay(attempt, error)
+
+        if time.monotonic() + delay >= deadline:
+            raise NaverDeadlineExceededError(f"deadline exceeded: {error}") from error
+
+        return delay
+
+    def get_timeout(self, remaining: float):
+        connect_timeout, read_timeout = self.attempt_timeout
+        return (min(connect_timeout, remaining), min(read_timeout, remaining))
+
+
+# 서버 쪽 오류가 연속으로 발생하면 일정 시간 동안 모든 요청을 멈춤
+# 멈춘 뒤 첫 요청이 다시 실패하면 바로 다시 멈춤
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._is_tripped = False
+        self._opened_until = 0.0
+
+    def get_remaining(self):
+        with self._lock:
+            return max(self._opened_until - time.monotonic(), 0.0)
+
+    def wait(self, deadline: float | None = None):
+        while remaining := self.get_remaining():
+            if deadline is not None and time.monotonic() + remaining > deadline:
+                raise NaverDeadlineExceededError("circuit breaker is open")
+
+            time.sleep(remaining)
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._is_tripped = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+
+            if self._is_tripped or self._failures >= self.failure_threshold:
+                self._opened_until = time.monotonic() + self.cooldown
+                self._failures = 0
+                self._is_tripped = True
+
+
+# spawn으로 띄운 워커 프로세스에 넘기면 모든 워커가 같은 차단 상태를 공유함
+# time.monotonic은 시스템 전체에서 같은 시계이므로 프로세스 사이에서 비교할 수 있음
+class SharedCircuitBreaker(CircuitBreaker):
+    def __init__(
+        self,
+        context: BaseContext,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = context.Lock()
+        self._shared_failures = context.Value("i", 0, lock=False)
+        self._shared_is_tripped = context.Value("b", False, lock=False)
+        self._shared_opened_until = context.Value("d", 0.0, lock=False)
+
+    @property
+    def _failures(self) -> int:
+        return self._shared_failures.value
+
+    @_failures.setter
+    def _failures(self, value: int):
+        self._shared_failures.value = value
+
+    @property
+    def _is_tripped(self) -> bool:
+        return bool(self._shared_is_tripped.value)
+
+    @_is_tripped.setter
+    def _is_tripped(self, value: bool):
+        self._shared_is_tripped.value = value
+
+    @property
+    def _opened_until(self) -> float:
+        return self._shared_opened_until.value
+
+    @_opened_until.setter
+    def _opened_until(self, value: float):
+        self._shared_opened_until.value = value
+
+
+# 같은 프로세스의 모든 세션이 공유함
+DEFAULT_CIRCUIT_BREAKER = CircuitBreaker()
+DEFAULT_RETRY_POLICY = RetryPolicy()
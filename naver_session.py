@@ -1,4 +1,6 @@
 import json
+import time
+from typing import Callable, TypeVar
 
 import chromedriver_autoinstaller_fix
 import requests
@@ -9,14 +11,104 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from naver_request import (
+    DEFAULT_CIRCUIT_BREAKER,
+    DEFAULT_RETRY_POLICY,
+    CircuitBreaker,
+    NaverClientError,
+    NaverDeadlineExceededError,
+    NaverRequestError,
+    NaverTransientError,
+    RetryPolicy,
+    classify_parse_error,
+    classify_status,
+)
+
 CHROMEDRIVER_PATH = "./chromedriver/"
 
+T = TypeVar("T")
+
 
 class NaverSession:
     session: requests.Session
-
-    def __init__(self, session: requests.Session):
+    retry_policy: RetryPolicy
+    circuit_breaker: CircuitBreaker
+
+    def __init__(
+        self,
+        session: requests.Session,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        circuit_breaker: CircuitBreaker = DEFAULT_CIRCUIT_BREAKER,
+    ):
         self.session = session
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+
+    def _send(self, method: str, url: str, timeout: tuple[float, float], **kwargs):
+        try:
+            res = self.session.request(method, url, timeout=timeout, **kwargs)
+        # 본문을 받는 도중 끊긴 경우(ChunkedEncodingError 등)도 재시도함
+        except (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ContentDecodingError,
+        ) as e:
+            raise NaverTransientError(f"{e!r} from {url}") from e
+        except requests.RequestException as e:
+            raise NaverClientError(f"{e!r} from {url}") from e
+
+        if error := classify_status(
+            url, res.status_code, res.headers.get("Retry-After")
+        ):
+            raise error
+
+        return res
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        parse: Callable[[requests.Response], T] | None = None,
+        **kwargs,
+    ) -> T | requests.Response:
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.deadline
+        attempt = 0
+
+        while True:
+            self.circuit_breaker.wait(deadline)
+
+            if (remaining := deadline - time.monotonic()) <= 0:
+                raise NaverDeadlineExceededError(f"deadline exceeded for {url}")
+
+            try:
+                res = self._send(method, url, policy.get_timeout(remaining), **kwargs)
+
+                try:
+                    result = parse(res) if parse else res
+                except (ValueError, KeyError, IndexError, TypeError) as e:
+                    raise classify_parse_error(
+                        url, res.status_code, res.content, e
+                    ) from e
+
+            except NaverRequestError as e:
+                if isinstance(e, NaverTransientError):
+                    self.circuit_breaker.record_failure()
+
+                attempt += 1
+                time.sleep(policy.get_retry_delay(e, attempt, deadline))
+                continue
+
+            self.circuit_breaker.record_success()
+            return result
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
 
     def save(self, file_name: str):
         cookies = self.session.cookies.get_dict()
@@ -30,13 +122,13 @@ class NaverSession:
         return webdriver.Chrome(service=Service(executable_path=driver_path))
 
     @classmethod
-    def from_cookies(cls, cookies: dict):
+    def from_cookies(cls, cookies: dict, **kwargs):
         s = requests.Session()
 
         for name, value in cookies.items():
             s.cookies.set(name, value)
 
-        return cls(s)
+        return cls(s, **kwargs)
 
     @classmethod
     def login(cls, username: str, password: str):
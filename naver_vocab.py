@@ -1,3 +1,5 @@
+import functools
+import itertools
 import json
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, TypedDict, cast
@@ -7,7 +9,17 @@ import requests
 
 from dto.word_search import WordSearchResult
 from naver_session import NaverSession
-from naver_vocab_entry import get_entry_dict
+from naver_vocab_book_cache import (
+    NaverVocabBookCache,
+    NaverVocabItemFingerprint,
+    get_content_hash,
+)
+from naver_vocab_entry import (
+    DEFAULT_PROFILE,
+    MEANING_SEPARATOR,
+    ExtractionProfile,
+    get_entry_dict,
+)
 
 if TYPE_CHECKING:
     from naver_vocab_book import NaverVocabBook
@@ -35,75 +47,146 @@ class NaverVocabListResponse(TypedDict):
 SEARCH_SIZE = 100
 
 
-def get_words_response(
-    naver_session: NaverSession,
-    *,
-    book: "NaverVocabBook",
-    cursor: str | None = None,
-):
+def get_words_link(book: "NaverVocabBook", cursor: str | None = None):
     book_id = book.book_id
 
     if cursor is None:
-        link = f"https://learn.dict.naver.com/gateway-api/{book.book_type}/mywordbook/word/list/search?wbId={book_id}&qt=0&st=0&page_size={SEARCH_SIZE}&domain=naver"
-    else:
-        link = f"https://learn.dict.naver.com/gateway-api/{book.book_type}/mywordbook/word/list/search?wbId={book_id}&qt=0&st=0&cursor={cursor}&page_size={SEARCH_SIZE}&domain=naver"
+        return f"https://learn.dict.naver.com/gateway-api/{book.book_type}/mywordbook/word/list/search?wbId={book_id}&qt=0&st=0&page_size={SEARCH_SIZE}&domain=naver"
 
-    vocabs_text = naver_session.session.get(link).text
+    return f"https://learn.dict.naver.com/gateway-api/{book.book_type}/mywordbook/word/list/search?wbId={book_id}&qt=0&st=0&cursor={cursor}&page_size={SEARCH_SIZE}&domain=naver"
 
-    if not vocabs_text:
-        return None
 
-    return cast(NaverVocabListResponse, json.loads(vocabs_text))
+def get_words_response(
+    naver_session: NaverSession,
+    *,
+    book: "NaverVocabBook",
+    cursor: str | None = None,
+    cache: NaverVocabBookCache | None = None,
+):
+    link = get_words_link(book, cursor)
+    cached_page = cache.get_page(link) if cache else None
+
+    def _parse(res: requests.Response):
+        if res.status_code == 304 and cached_page:
+            return json.loads(cached_page.body)
+
+        # 빈 응답은 NaverResponseError로 분류되어 재시도됨
+        result = json.loads(res.text)
+
+        # JSON이 아닌 응답(게이트웨이 오류 페이지 등)이 캐시되어 304로 계속
+        # 재사용되지 않도록 파싱에 성공한 뒤에만 저장함
+        if cache:
+            cache.save_page(link, res)
+
+        return result
+
+    return cast(
+        NaverVocabListResponse,
+        naver_session.get(
+            link,
+            headers=cached_page.get_headers() if cached_page else None,
+            parse=_parse,
+        ),
+    )
 
 
-def get_vocabs(naver_session: NaverSession, book: "NaverVocabBook"):
+def get_vocabs(
+    naver_session: NaverSession,
+    book: "NaverVocabBook",
+    cache: NaverVocabBookCache | None = None,
+    profile: ExtractionProfile = DEFAULT_PROFILE,
+):
     cursor = None
     words: list[NaverVocab] = []
+    cached_items = cache.get_items(book) if cache else {}
+    items: list[NaverVocabItemFingerprint] = []
+    m_total = None
+    is_changed = False
 
     while (
-        (response := get_words_response(naver_session, book=book, cursor=cursor))
+        (
+            response := get_words_response(
+                naver_session, book=book, cursor=cursor, cache=cache
+            )
+        )
         and response["data"]
         and response["data"]["over_last_page"] is False
     ):
-        words += [
-            NaverVocab(
-                id=item["id"],
-                **get_entry_dict(book.book_type, json.loads(item["content"])),
-            )
-            for item in response["data"]["m_items"]
-            if item["content"]
-        ]
+        m_total = response["data"]["m_total"]
+
+        for item in response["data"]["m_items"]:
+            if not item["content"]:
+                continue
+
+            content_hash = get_content_hash(item["content"], profile)
+
+            # 내용이 바뀌지 않은 단어는 다시 파싱하지 않음
+            if (
+                cached_item := cached_items.get(item["id"])
+            ) and cached_item.content_hash == content_hash:
+                entry = cached_item.entry
+            else:
+                entry = get_entry_dict(
+                    book.book_type, json.loads(item["content"]), profile
+                )
+                is_changed = True
+
+            words.append(NaverVocab(id=item["id"], **entry))
+            items.append(NaverVocabItemFingerprint(item["id"], content_hash, entry))
 
         cursor = response["data"]["next_cursor"]
 
+    if cache and m_total is not None:
+        if (
+            is_changed
+            or len(items) != len(cached_items)
+            or m_total != cache.get_m_total(book)
+        ):
+            cache.save_book(book, m_total, items)
+
     return words
 
 
-# FIXME:
+# 단어장 API는 "jakodict", 검색 API는 "jako" 형식을 사용함
+@functools.cache
 def get_dictionary_type(vocab_book_type: "NaverVocabBook.Type"):
-    return vocab_book_type.value.rstrip("dict")
+    return vocab_book_type.value.removesuffix("dict")
+
+
+SEARCH_HEADERS = {
+    "Referer": "https://dict.naver.com/",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+}
+
+
+def get_search_link(dict_type: str, word: str):
+    return f"https://dict.naver.com/api3/{dict_type}/search?query={word}"
+
+
+# 첫 번째 검색 결과만 사용하므로 나머지는 검증하기 전에 버림
+def parse_search_result(json_result: dict):
+    word_field = json_result["searchResultMap"]["searchResultListMap"]["WORD"]
+    word_field["items"] = word_field["items"][:1]
+    return WordSearchResult.model_validate(json_result)
 
 
 def get_vocab_from_word(
-    naver_session: NaverSession, dict_type: str, word: str
+    naver_session: NaverSession,
+    dict_type: str,
+    word: str,
+    profile: ExtractionProfile = DEFAULT_PROFILE,
 ) -> "NaverVocab | None":
-    res = requests.get(
-        f"https://dict.naver.com/api3/{dict_type}/search?query={word}",
-        headers={
-            "Referer": "https://dict.naver.com/",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-        },
+    result = naver_session.get(
+        get_search_link(dict_type, word),
+        headers=SEARCH_HEADERS,
+        parse=lambda res: parse_search_result(res.json()),
     )
+    return get_vocab_from_search_result(result, profile)
 
-    json_result = res.json()
-
-    with open(f"files/{word}.json", "w", encoding="utf-8") as f:
-        json.dump(json_result, f)
-
-    # with open(f"files/{word}.json", "r", encoding="utf-8") as f:
-    #     json_result = json.load(f)
 
-    result = WordSearchResult.model_validate(json_result)
+def get_vocab_from_search_result(
+    result: WordSearchResult, profile: ExtractionProfile = DEFAULT_PROFILE
+) -> "NaverVocab | None":
     word_items = result.searchResultMap.searchResultListMap.WORD.items
 
     if not word_items:
@@ -119,15 +202,20 @@ def get_vocab_from_word(
         return 3
 
     word_item = word_items[0]
-    mean = (
-        (
-            means[0]
-            if (means := [item for item in collector[0].means if item.value])
-            else None
+    means = (
+        list(
+            itertools.islice(
+                (item for item in collector[0].means if item.value),
+                profile.max_meanings,
+            )
         )
         if (collector := word_item.meansCollector)
-        else None
+        else []
     )
+
+    if not means:
+        return None
+
     symbol = (
         symbol_list[0]
         if (
@@ -142,14 +230,24 @@ def get_vocab_from_word(
         )
         else None
     )
+    examples = (
+        list(
+            itertools.islice(
+                (unquote_plus(mean.encode) for mean in means if mean.encode),
+                profile.max_examples,
+            )
+        )
+        if profile.include_examples
+        else []
+    )
 
     return NaverVocab(
         id=word_item.entryId,
         word=unquote_plus(word_item.encode),
-        meaning=mean.value,
-        pron=symbol.symbolValue if symbol else None,
-        pron_file=symbol.symbolFile if symbol else None,
-        examples=[unquote_plus(mean.encode)] if mean.encode else [],
+        meaning=MEANING_SEPARATOR.join(mean.value for mean in means),
+        pron=symbol.symbolValue if symbol and profile.include_pron else None,
+        pron_file=symbol.symbolFile if symbol and profile.include_pron_file else None,
+        examples=examples,
     )
 
 
@@ -169,9 +267,18 @@ class NaverVocab:
     def get_pron_file_link(self, naver_session: NaverSession):
         if self.pron_file is None:
             return None
-        res = naver_session.session.post(
-            "https://learn.dict.naver.com/api/pronunLink.dict",
-            data={"filePath": self.pron_file, "dmain": "naver"},
+        return naver_session.post(
+            PRON_LINK_URL,
+            data=self.get_pron_link_data(),
+            parse=lambda res: parse_pron_link(res.json()),
         )
-        res_json = json.loads(res.text)
-        return res_json["data"]["pronunLinkList"][0]
+
+    def get_pron_link_data(self):
+        return {"filePath": self.pron_file, "dmain": "naver"}
+
+
+PRON_LINK_URL = "https://learn.dict.naver.com/api/pronunLink.dict"
+
+
+def parse_pron_link(json_result: dict) -> str:
+    return json_result["data"]["pronunLinkList"][0]
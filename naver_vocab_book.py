@@ -1,10 +1,11 @@
 import enum
-import json
 from dataclasses import dataclass, field
 from typing import cast
 
 from naver_session import NaverSession
 from naver_vocab import NaverVocab, get_vocabs
+from naver_vocab_book_cache import NaverVocabBookCache
+from naver_vocab_entry import DEFAULT_PROFILE, ExtractionProfile
 
 
 class NaverVocabBookResponse:
@@ -37,28 +38,53 @@ class NaverVocabBook:
     book_id: str
     book_name: str
     book_type: Type
+    word_count: int | None = None
     vocabs: list[NaverVocab] | None = field(init=False, default=None)
 
     @staticmethod
-    def get_book_list_response(naver_session: NaverSession, book_type: Type):
+    def get_book_list_link(book_type: Type):
         # FIXME: 편의상 처음 100개만 확인함
-        vocab_lists_text = naver_session.session.get(
-            f"https://learn.dict.naver.com/gateway-api/{book_type}/mywordbook/wordbook/list.dict?page={1}&page_size={100}&st=0&domain=naver"
+        return f"https://learn.dict.naver.com/gateway-api/{book_type}/mywordbook/wordbook/list.dict?page={1}&page_size={100}&st=0&domain=naver"
+
+    @staticmethod
+    def get_book_list_response(naver_session: NaverSession, book_type: Type):
+        return cast(
+            NaverVocabBookListResponse,
+            naver_session.get(
+                NaverVocabBook.get_book_list_link(book_type),
+                parse=lambda res: res.json(),
+            ),
         )
 
-        return cast(NaverVocabBookListResponse, json.loads(vocab_lists_text.text))
+    @staticmethod
+    def get_book_from_item(item: NaverVocabBookResponse, book_type: Type):
+        return NaverVocabBook(
+            book_id=item["id"],
+            book_type=book_type,
+            book_name=item["name"],
+            word_count=item.get("wordCount"),
+        )
 
     @staticmethod
-    def get_book_list(naver_session: NaverSession, book_type: Type):
+    def get_books_from_response(response: NaverVocabBookListResponse, book_type: Type):
         return [
-            NaverVocabBook(
-                book_id=item["id"], book_type=book_type, book_name=item["name"]
-            )
-            for item in NaverVocabBook.get_book_list_response(naver_session, book_type)[
-                "data"
-            ]["m_items"]
+            NaverVocabBook.get_book_from_item(item, book_type)
+            for item in response["data"]["m_items"]
         ]
 
+    def to_item(self) -> NaverVocabBookResponse:
+        return {
+            "id": self.book_id,
+            "name": self.book_name,
+            "wordCount": self.word_count,
+        }
+
+    @staticmethod
+    def get_book_list(naver_session: NaverSession, book_type: Type):
+        return NaverVocabBook.get_books_from_response(
+            NaverVocabBook.get_book_list_response(naver_session, book_type), book_type
+        )
+
     @staticmethod
     def get_book_from_id(naver_session: NaverSession, book_id: str, book_type: Type):
         return next(
@@ -69,6 +95,11 @@ class NaverVocabBook:
             )
         )
 
-    def load_vocabs(self, naver_session: NaverSession):
-        self.vocabs = get_vocabs(naver_session, self)
+    def load_vocabs(
+        self,
+        naver_session: NaverSession,
+        cache: NaverVocabBookCache | None = None,
+        profile: ExtractionProfile = DEFAULT_PROFILE,
+    ):
+        self.vocabs = get_vocabs(naver_session, self, cache, profile)
         return self
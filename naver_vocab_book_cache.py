@@ -0,0 +1,151 @@
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import requests
+
+if TYPE_CHECKING:
+    from naver_vocab_book import NaverVocabBook
+    from naver_vocab_entry import ExtractionProfile, NaverVocabEntryDict
+
+VOCAB_BOOK_CACHE_PATH = "vocab_book_cache.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS page (
+    link TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS book (
+    book_type TEXT NOT NULL,
+    book_id TEXT NOT NULL,
+    m_total INTEGER NOT NULL,
+    PRIMARY KEY (book_type, book_id)
+);
+CREATE TABLE IF NOT EXISTS item (
+    book_type TEXT NOT NULL,
+    book_id TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    entry TEXT NOT NULL,
+    PRIMARY KEY (book_type, book_id, item_id)
+);
+"""
+
+
+# 추출 프로필이 바뀌면 저장된 항목도 다시 파싱해야 하므로 함께 해시함
+def get_content_hash(content: str, profile: "ExtractionProfile"):
+    return hashlib.blake2b(
+        f"{profile!r}\0{content}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+class NaverVocabCachedPage(NamedTuple):
+    etag: str | None
+    last_modified: str | None
+    body: str
+
+    def get_headers(self) -> dict[str, str]:
+        headers = {}
+
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+class NaverVocabItemFingerprint(NamedTuple):
+    item_id: str
+    content_hash: str
+    entry: "NaverVocabEntryDict"
+
+
+class NaverVocabBookCache:
+    connection: sqlite3.Connection
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.connection.executescript(SCHEMA)
+
+    @classmethod
+    def from_file(cls, file_name: str | Path = VOCAB_BOOK_CACHE_PATH):
+        return cls(sqlite3.connect(file_name))
+
+    def close(self):
+        self.connection.close()
+
+    def get_page(self, link: str) -> NaverVocabCachedPage | None:
+        row = self.connection.execute(
+            "SELECT etag, last_modified, body FROM page WHERE link = ?", (link,)
+        ).fetchone()
+        return NaverVocabCachedPage(*row) if row else None
+
+    def save_page(self, link: str, response: requests.Response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        # 조건부 요청에 쓸 수 없는 응답은 저장할 필요가 없음
+        if not (etag or last_modified) or not response.text:
+            return
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO page (link, etag, last_modified, body) "
+                "VALUES (?, ?, ?, ?)",
+                (link, etag, last_modified, response.text),
+            )
+
+    def get_m_total(self, book: "NaverVocabBook") -> int | None:
+        row = self.connection.execute(
+            "SELECT m_total FROM book WHERE book_type = ? AND book_id = ?",
+            (str(book.book_type), book.book_id),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_items(self, book: "NaverVocabBook") -> dict[str, NaverVocabItemFingerprint]:
+        rows = self.connection.execute(
+            "SELECT item_id, content_hash, entry FROM item "
+            "WHERE book_type = ? AND book_id = ?",
+            (str(book.book_type), book.book_id),
+        )
+        return {
+            item_id: NaverVocabItemFingerprint(item_id, content_hash, json.loads(entry))
+            for item_id, content_hash, entry in rows
+        }
+
+    def save_book(
+        self,
+        book: "NaverVocabBook",
+        m_total: int,
+        items: list[NaverVocabItemFingerprint],
+    ):
+        book_key = (str(book.book_type), book.book_id)
+
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO book (book_type, book_id, m_total) "
+                "VALUES (?, ?, ?)",
+                (*book_key, m_total),
+            )
+            self.connection.execute(
+                "DELETE FROM item WHERE book_type = ? AND book_id = ?", book_key
+            )
+            self.connection.executemany(
+                "INSERT INTO item (book_type, book_id, item_id, content_hash, entry) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        *book_key,
+                        item.item_id,
+                        item.content_hash,
+                        json.dumps(item.entry, ensure_ascii=False),
+                    )
+                    for item in items
+                ],
+            )
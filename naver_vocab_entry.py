@@ -1,5 +1,7 @@
 import functools
-from typing import TYPE_CHECKING, TypedDict
+import itertools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator, TypedDict
 
 import utils
 from utils import RegexPattern
@@ -148,17 +150,38 @@ def get_pron_file(
             raise NotImplementedError
 
 
-def get_valid_mean(means: list[NaverVocabEntryResponseEntryMean]):
-    return next(mean for mean in means if mean["show_mean"] != "")
+def get_valid_means(
+    means: list[NaverVocabEntryResponseEntryMean],
+) -> Iterator[NaverVocabEntryResponseEntryMean]:
+    return (mean for mean in means if mean["show_mean"] != "")
 
 
-def get_valid_examples_for_mean(mean: NaverVocabEntryResponseEntryMean):
-    examples = [
-        example.get("origin_example", example.get("show_example"))
+def get_valid_examples_for_mean(
+    mean: NaverVocabEntryResponseEntryMean,
+) -> Iterator[str]:
+    return (
+        item
         for example in mean["examples"]
-    ]
-    examples = [item for item in examples if item]
-    return examples
+        if (item := example.get("origin_example", example.get("show_example")))
+    )
+
+
+# 여러 뜻은 ANKI 카드에서 줄바꿈으로 보이도록 합침
+MEANING_SEPARATOR = "<br/>"
+
+
+@dataclass(frozen=True)
+class ExtractionProfile:
+    # None이면 개수 제한 없음
+    max_meanings: int | None = 1
+    max_examples: int | None = 1
+    include_pron: bool = True
+    include_pron_file: bool = True
+    include_examples: bool = True
+
+
+DEFAULT_PROFILE = ExtractionProfile()
+FULL_PROFILE = ExtractionProfile(max_meanings=None, max_examples=None)
 
 
 class NaverVocabEntryDict(TypedDict):
@@ -171,17 +194,42 @@ class NaverVocabEntryDict(TypedDict):
 
 
 def get_entry_dict(
-    book_type: "NaverVocabBook.Type", entry_dict: NaverVocabEntryResponse
+    book_type: "NaverVocabBook.Type",
+    entry_dict: NaverVocabEntryResponse,
+    profile: ExtractionProfile = DEFAULT_PROFILE,
 ):
     member = entry_dict["entry"]["members"][0]
-    mean = get_valid_mean(entry_dict["entry"]["means"])
-    examples = get_valid_examples_for_mean(mean)
+
+    # 프로필을 채우면 나머지 뜻과 예문은 보지 않음
+    means = list(
+        itertools.islice(
+            get_valid_means(entry_dict["entry"]["means"]), profile.max_meanings
+        )
+    )
+
+    if not means:
+        raise ValueError(f"no valid mean for entry {entry_dict['entry']['entry_id']}")
+
+    examples = (
+        list(
+            itertools.islice(
+                itertools.chain.from_iterable(
+                    get_valid_examples_for_mean(mean) for mean in means
+                ),
+                profile.max_examples,
+            )
+        )
+        if profile.include_examples
+        else []
+    )
 
     return NaverVocabEntryDict(
         word=get_word(book_type, member),
-        meaning=get_meaning(book_type, mean),
-        pron=get_pron(book_type, member),
-        pron_file=get_pron_file(book_type, member),
+        meaning=MEANING_SEPARATOR.join(get_meaning(book_type, mean) for mean in means),
+        pron=get_pron(book_type, member) if profile.include_pron else "",
+        pron_file=get_pron_file(book_type, member)
+        if profile.include_pron_file
+        else None,
         remarks=None,
         examples=examples,
     )
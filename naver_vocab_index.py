@@ -0,0 +1,140 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from naver_vocab import NaverVocab
+
+if TYPE_CHECKING:
+    from naver_vocab_book import NaverVocabBook
+
+VOCAB_INDEX_PATH = "vocab_index.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vocab (
+    book_type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    word TEXT NOT NULL,
+    meaning TEXT NOT NULL,
+    pron TEXT,
+    pron_file TEXT,
+    remarks TEXT,
+    examples TEXT,
+    PRIMARY KEY (book_type, id)
+);
+CREATE TABLE IF NOT EXISTS vocab_query (
+    book_type TEXT NOT NULL,
+    query TEXT NOT NULL,
+    id TEXT NOT NULL,
+    PRIMARY KEY (book_type, query)
+);
+CREATE INDEX IF NOT EXISTS vocab_word ON vocab (book_type, word);
+"""
+
+# 이전 버전에서 만든 발음/부분 검색용 색인은 쓰는 곳이 없으므로 지움
+DROP_UNUSED_SCHEMA = """
+DROP TRIGGER IF EXISTS vocab_ai;
+DROP TRIGGER IF EXISTS vocab_ad;
+DROP TRIGGER IF EXISTS vocab_au;
+DROP TABLE IF EXISTS vocab_fts;
+DROP INDEX IF EXISTS vocab_pron;
+"""
+
+VOCAB_COLUMNS = "id, word, meaning, pron, pron_file, remarks, examples"
+JOINED_VOCAB_COLUMNS = ", ".join(f"vocab.{c}" for c in VOCAB_COLUMNS.split(", "))
+
+
+class NaverVocabIndex:
+    connection: sqlite3.Connection
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.connection.executescript(SCHEMA + DROP_UNUSED_SCHEMA)
+
+    @classmethod
+    def from_file(cls, file_name: str | Path = VOCAB_INDEX_PATH):
+        return cls(sqlite3.connect(file_name))
+
+    def close(self):
+        self.connection.close()
+
+    @staticmethod
+    def _to_vocab(row: tuple) -> NaverVocab:
+        id, word, meaning, pron, pron_file, remarks, examples = row
+        return NaverVocab(
+            id=id,
+            word=word,
+            meaning=meaning,
+            pron=pron,
+            pron_file=pron_file,
+            remarks=remarks,
+            examples=json.loads(examples) if examples is not None else None,
+        )
+
+    def add(self, book_type: "NaverVocabBook.Type", vocabs: list[NaverVocab]):
+        with self.connection:
+            self.connection.executemany(
+                f"""
+                INSERT INTO vocab (book_type, {VOCAB_COLUMNS})
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (book_type, id) DO UPDATE SET
+                    word = excluded.word,
+                    meaning = excluded.meaning,
+                    pron = excluded.pron,
+                    pron_file = excluded.pron_file,
+                    remarks = excluded.remarks,
+                    examples = excluded.examples
+                """,
+                [
+                    (
+                        str(book_type),
+                        vocab.id,
+                        vocab.word,
+                        vocab.meaning,
+                        vocab.pron,
+                        vocab.pron_file,
+                        vocab.remarks,
+                        json.dumps(vocab.examples, ensure_ascii=False)
+                        if vocab.examples is not None
+                        else None,
+                    )
+                    for vocab in vocabs
+                ],
+            )
+
+    # 검색어와 검색 결과의 표제어가 다를 수 있으므로 검색어도 함께 기록함
+    def add_query(self, book_type: "NaverVocabBook.Type", query: str, vocab_id: str):
+        self.add_queries(book_type, [(query, vocab_id)])
+
+    def add_queries(
+        self, book_type: "NaverVocabBook.Type", queries: list[tuple[str, str]]
+    ):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO vocab_query (book_type, query, id) "
+                "VALUES (?, ?, ?)",
+                [(str(book_type), query, vocab_id) for query, vocab_id in queries],
+            )
+
+    # 네트워크 검색을 대신하므로 발음만 같은 동음이의어는 돌려주지 않음
+    def get(self, book_type: "NaverVocabBook.Type", word: str) -> NaverVocab | None:
+        row = self.connection.execute(
+            f"""
+            SELECT {JOINED_VOCAB_COLUMNS}
+            FROM vocab_query JOIN vocab USING (book_type, id)
+            WHERE vocab_query.book_type = ? AND vocab_query.query = ?
+            """,
+            (str(book_type), word),
+        ).fetchone()
+
+        if not row:
+            row = self.connection.execute(
+                f"""
+                SELECT {VOCAB_COLUMNS} FROM vocab
+                WHERE book_type = ? AND word = ?
+                LIMIT 1
+                """,
+                (str(book_type), word),
+            ).fetchone()
+
+        return self._to_vocab(row) if row else None
@@ -0,0 +1,196 @@
+import multiprocessing
+import queue
+import time
+from typing import NamedTuple
+
+from tqdm import tqdm
+
+from naver_request import CircuitBreaker, NaverRequestError, SharedCircuitBreaker
+from naver_session import NaverSession
+from naver_vocab import NaverVocab, get_dictionary_type, get_vocab_from_word
+from naver_vocab_book import NaverVocabBook
+from naver_vocab_entry import DEFAULT_PROFILE, ExtractionProfile
+
+REQUEST_INTERVAL = 0.3
+
+SHARD_SIZE = 100
+# 모든 워커를 합친 초당 요청 수
+SHARDED_REQUESTS_PER_SECOND = 10.0
+
+
+class WordShard(NamedTuple):
+    index: int
+    words: list[str]
+
+
+class WordLookupResult(NamedTuple):
+    vocabs: list[tuple[str, NaverVocab | None]]
+    failed: list[str]
+
+
+def lookup_words(
+    session: NaverSession,
+    book_type: NaverVocabBook.Type,
+    words: list[str],
+    profile: ExtractionProfile = DEFAULT_PROFILE,
+    request_interval: float = REQUEST_INTERVAL,
+    show_progress: bool = True,
+):
+    vocabs: list[tuple[str, NaverVocab | None]] = []
+    failed: list[str] = []
+
+    for word in tqdm(
+        words, desc="네이버 단어장에서 단어 가져오는 중", disable=not show_progress
+    ):
+        start = time.monotonic()
+
+        try:
+            vocabs.append(
+                (
+                    word,
+                    get_vocab_from_word(
+                        session, get_dictionary_type(book_type), word, profile
+                    ),
+                )
+            )
+
+        # 한 단어가 실패해도 나머지 단어는 계속 가져옴
+        except (NaverRequestError, ValueError, KeyError, IndexError, TypeError):
+            vocabs.append((word, None))
+            failed.append(word)
+
+        time.sleep(max(request_interval - (time.monotonic() - start), 0))
+
+    return WordLookupResult(vocabs, failed)
+
+
+def _get_failed_result(shard: WordShard):
+    return WordLookupResult([(word, None) for word in shard.words], shard.words)
+
+
+def _lookup_worker(
+    worker_index: int,
+    cookies: dict,
+    book_type: NaverVocabBook.Type,
+    profile: ExtractionProfile,
+    request_interval: float,
+    circuit_breaker: CircuitBreaker,
+    shard_queue: multiprocessing.Queue,
+    result_queue: multiprocessing.Queue,
+):
+    # 워커마다 자기 세션(연결 풀)을 갖지만 서킷 브레이커는 모든 워커가 공유함
+    session = NaverSession.from_cookies(cookies, circuit_breaker=circuit_breaker)
+
+    # 남은 조각을 먼저 가져가는 워커가 처리하므로 느린 워커에 일이 몰리지 않음
+    while (shard := shard_queue.get()) is not None:
+        # 워커가 죽었을 때 어느 조각을 잃었는지 알 수 있도록 시작을 먼저 알림
+        result_queue.put((worker_index, shard.index, None))
+        result = lookup_words(
+            session,
+            book_type,
+            shard.words,
+            profile,
+            request_interval,
+            show_progress=False,
+        )
+        result_queue.put((worker_index, shard.index, result))
+
+
+def lookup_words_sharded(
+    session: NaverSession,
+    book_type: NaverVocabBook.Type,
+    words: list[str],
+    profile: ExtractionProfile = DEFAULT_PROFILE,
+    num_workers: int | None = None,
+    shard_size: int = SHARD_SIZE,
+    requests_per_second: float = SHARDED_REQUESTS_PER_SECOND,
+):
+    shards = [
+        WordShard(index, words[start : start + shard_size])
+        for index, start in enumerate(range(0, len(words), shard_size))
+    ]
+    num_workers = min(num_workers or multiprocessing.cpu_count(), len(shards))
+
+    if not num_workers:
+        return WordLookupResult([], [])
+
+    context = multiprocessing.get_context("spawn")
+    shard_queue = context.Queue()
+    result_queue = context.Queue()
+    circuit_breaker = SharedCircuitBreaker(
+        context,
+        session.circuit_breaker.failure_threshold,
+        session.circuit_breaker.cooldown,
+    )
+
+    for shard in shards:
+        shard_queue.put(shard)
+
+    for _ in range(num_workers):
+        shard_queue.put(None)
+
+    workers = [
+        context.Process(
+            target=_lookup_worker,
+            args=(
+                worker_index,
+                session.session.cookies.get_dict(),
+                book_type,
+                profile,
+                num_workers / requests_per_second,
+                circuit_breaker,
+                shard_queue,
+                result_queue,
+            ),
+            daemon=True,
+        )
+        for worker_index in range(num_workers)
+    ]
+
+    for worker in workers:
+        worker.start()
+
+    results: dict[int, WordLookupResult] = {}
+    # 워커별로 처리 중인 조각
+    current: dict[int, int] = {}
+
+    with tqdm(
+        total=len(shards), desc=f"단어 조각을 가져오는 중 (워커 {num_workers}개)"
+    ) as progress:
+        while len(results) < len(shards):
+            try:
+                worker_index, index, result = result_queue.get(timeout=1)
+            except queue.Empty:
+                # 조각을 처리하던 워커가 죽으면(OOM, 시그널 등) 그 조각만 실패로 돌려주고
+                # 이미 끝난 조각은 그대로 사용함
+                for worker_index, worker in enumerate(workers):
+                    if not worker.is_alive() and worker_index in current:
+                        index = current.pop(worker_index)
+                        results[index] = _get_failed_result(shards[index])
+                        progress.update()
+
+                if not any(worker.is_alive() for worker in workers):
+                    break
+                continue
+
+            if result is None:
+                current[worker_index] = index
+                continue
+
+            current.pop(worker_index, None)
+            results[index] = result
+            progress.update()
+
+    for worker in workers:
+        worker.join()
+
+    # 모든 워커가 죽어 아무도 가져가지 않은 조각도 실패로 돌려줌
+    for shard in shards:
+        if shard.index not in results:
+            results[shard.index] = _get_failed_result(shard)
+
+    # 원래 행 순서대로 합침
+    return WordLookupResult(
+        [vocab for index in range(len(shards)) for vocab in results[index].vocabs],
+        [word for index in range(len(shards)) for word in results[index].failed],
+    )
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+
+from tqdm import tqdm
+
+PRON_AUDIO_CACHE_PATH = "pron_audio_cache/"
+FFMPEG = "ffmpeg"
+
+
+@dataclass(frozen=True)
+class AudioProcessingOptions:
+    # EBU R128 목표 음량 (LUFS)
+    loudness: float = -16.0
+    true_peak: float = -1.5
+    bitrate: str = "32k"
+    trim_silence: bool = True
+    silence_threshold: str = "-50dB"
+    extension: str = ".ogg"
+
+    def get_filter(self):
+        filters = []
+
+        # 앞뒤 무음을 자르기 위해 뒤집어서 한 번 더 자름
+        if self.trim_silence:
+            trim = f"silenceremove=start_periods=1:start_threshold={self.silence_threshold}"
+            filters += [trim, "areverse", trim, "areverse"]
+
+        filters.append(f"loudnorm=I={self.loudness}:TP={self.true_peak}:LRA=11")
+
+        return ",".join(filters)
+
+    def get_command(self, source: Path, output: Path):
+        return [
+            FFMPEG,
+            "-nostdin",
+            "-y",
+            "-loglevel",
+            "error",
+            "-i",
+            str(source),
+            "-af",
+            self.get_filter(),
+            "-c:a",
+            "libopus",
+            "-b:a",
+            self.bitrate,
+            "-vbr",
+            "on",
+            str(output),
+        ]
+
+
+DEFAULT_OPTIONS = AudioProcessingOptions()
+
+
+class ProcessedAudio(NamedTuple):
+    source: Path
+    output: Path | None
+    source_size: int
+    output_size: int
+    is_cached: bool
+
+
+class AudioProcessingReport(NamedTuple):
+    files: list[ProcessedAudio]
+    elapsed: float
+
+    @property
+    def source_size(self):
+        return sum(file.source_size for file in self.files if file.output)
+
+    @property
+    def output_size(self):
+        return sum(file.output_size for file in self.files if file.output)
+
+    def __str__(self):
+        processed = [file for file in self.files if file.output]
+        cached = sum(file.is_cached for file in processed)
+        ratio = 1 - self.output_size / self.source_size if self.source_size else 0
+
+        return (
+            f"발음 파일 {len(processed)}/{len(self.files)}개 변환 (캐시 {cached}개): "
+            f"{self.source_size / 1024:,.1f}KB -> {self.output_size / 1024:,.1f}KB "
+            f"({ratio:.1%} 감소), {self.elapsed:.1f}초"
+        )
+
+
+def is_available():
+    return shutil.which(FFMPEG) is not None
+
+
+def get_cache_key(source: bytes, options: AudioProcessingOptions):
+    return hashlib.sha256(repr(options).encode("utf-8") + b"\0" + source).hexdigest()
+
+
+# 프로세스 풀에서 실행되므로 모듈 최상위 함수여야 함
+def process_file(
+    source: Path, options: AudioProcessingOptions, cache_dir: Path
+) -> ProcessedAudio:
+    source_size = 0
+
+    # 파일 하나를 읽거나 쓰지 못해도 나머지 파일은 계속 변환함
+    try:
+        data = source.read_bytes()
+        source_size = len(data)
+        cached = cache_dir.joinpath(get_cache_key(data, options) + options.extension)
+        output = source.with_suffix(options.extension)
+        is_cached = cached.exists()
+
+        if not is_cached:
+            # 중간에 실패한 파일이 캐시에 남지 않도록 임시 파일에 쓴 뒤 옮김
+            temp = cached.with_name(
+                f"{cached.stem}.{os.getpid()}.tmp{options.extension}"
+            )
+
+            try:
+                subprocess.run(options.get_command(source, temp), check=True)
+            except subprocess.CalledProcessError:
+                temp.unlink(missing_ok=True)
+                return ProcessedAudio(source, None, source_size, 0, False)
+
+            temp.replace(cached)
+
+        shutil.copyfile(cached, output)
+
+        if output != source:
+            source.unlink()
+
+        return ProcessedAudio(
+            source, output, source_size, output.stat().st_size, is_cached
+        )
+
+    except OSError:
+        return ProcessedAudio(source, None, source_size, 0, False)
+
+
+def process_files(
+    sources: list[Path],
+    options: AudioProcessingOptions = DEFAULT_OPTIONS,
+    cache_dir: str | Path = PRON_AUDIO_CACHE_PATH,
+    max_workers: int | None = None,
+):
+    # 같은 파일을 두 워커가 동시에 변환하고 지우지 않도록 중복을 제거함
+    sources = list(dict.fromkeys(sources))
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        files = list(
+            tqdm(
+                executor.map(
+                    process_file,
+                    sources,
+                    [options] * len(sources),
+                    [cache_dir] * len(sources),
+                    chunksize=8,
+                ),
+                total=len(sources),
+                desc="발음 파일을 변환하는 중",
+            )
+        )
+
+    return AudioProcessingReport(files, time.perf_counter() - start)